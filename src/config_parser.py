@@ -2,10 +2,9 @@
 
 import os
 import sys
-import json
 
 from dataclasses import dataclass
-from typing import Optional, Union, List, Any, Callable, Iterable, Type, cast
+from typing import Optional, Union, List, Any, Callable, Type, cast
 
 from .tools import Utils, Logger
 from ..config.consts import *
@@ -28,9 +27,39 @@ def from_none(x: Any) -> Any:
 
 def from_list(f: Callable[[Any], T], x: Any) -> List[T]:
     Utils.check_instance(x, list)
-    return [f(y) for y in x]
+    return list(map(f, x))
+
+def from_str_list(x: Any) -> List[str]:
+    Utils.check_instance(x, list)
+    # lists that are already all str (the common case) are returned as they are, without a copy
+    if all(type(y) is str for y in x):
+        return x
+    return [from_str(y) for y in x]
+
+# specialized optional converters: exact matches return directly, anything else goes through the checked converter
+def from_optional_bool(x: Any) -> Optional[bool]:
+    if x is None or type(x) is bool:
+        return x
+    return from_bool(x)
+
+def from_optional_int(x: Any) -> Optional[int]:
+    if x is None or type(x) is int:
+        return x
+    return from_int(x)
+
+def from_optional_str(x: Any) -> Optional[str]:
+    if x is None or type(x) is str:
+        return x
+    return from_str(x)
+
+# exact python type -> converter, used by from_union to pick the right candidate without raising
+_TYPE_CONVERTERS = { bool: from_bool, int: from_int, str: from_str, type(None): from_none }
+
+def from_union(fs: List[Callable[[Any], Any]], x: Any):
+    f = _TYPE_CONVERTERS.get(type(x))
+    if f is not None and f in fs:
+        return f(x)
 
-def from_union(fs: Iterable[Any], x: Any):
     for f in fs:
         try:
             return f(x)
@@ -44,7 +73,11 @@ def to_class(c: Type[T], x: Any) -> dict:
     return cast(Any, x).serialize()
 
 
-@dataclass
+# slotted dataclasses need python 3.10+, older interpreters fall back to a regular __dict__
+_DC_KW = { "slots": True } if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DC_KW)
 class ObjectList:
     obj_id: Optional[int]
     obj_desc: Optional[str]
@@ -52,26 +85,26 @@ class ObjectList:
     @classmethod
     def deserialize(cls, obj: Any) -> 'ObjectList':
         try:
-            obj_id = from_union([from_none, from_int], obj.get(CONFIG_OBJECT_OBJ_ID))
-            obj_desc = from_union([from_none, from_str], obj.get(CONFIG_OBJECT_OBJ_DESC))
+            obj_id = from_optional_int(obj.get(CONFIG_OBJECT_OBJ_ID))
+            obj_desc = from_optional_str(obj.get(CONFIG_OBJECT_OBJ_DESC))
         except ValueError as ve:
             Logger.instance().critical(ve.args)
             sys.exit(-1)
 
-        Logger.instance().info(f"ObjectList:: obj_id: {obj_id}, obj_desc: {obj_desc}")
+        Logger.instance().info("ObjectList:: obj_id: %s, obj_desc: %s", obj_id, obj_desc)
         return ObjectList(obj_id, obj_desc)
 
     def serialize(self) -> dict:
-        result: dict = {}
-        
-        result[CONFIG_OBJECT_OBJ_ID] = from_union([from_none, from_int], self.obj_id)
-        result[CONFIG_OBJECT_OBJ_DESC] = from_union([from_none, from_str], self.obj_desc)
+        result: dict = {
+            CONFIG_OBJECT_OBJ_ID: from_optional_int(self.obj_id),
+            CONFIG_OBJECT_OBJ_DESC: from_optional_str(self.obj_desc)
+        }
 
-        Logger.instance().info(f"ObjectList serialized: {result}")
+        Logger.instance().info("ObjectList serialized: %s", result)
         return result
 
 
-@dataclass
+@dataclass(**_DC_KW)
 class Config:
     sample_bool: Optional[bool] = None
     sample_path: Optional[str] = None
@@ -88,13 +121,13 @@ class Config:
             sample_bool_tmp = from_union([from_str, from_bool, from_none], obj.get(CONFIG_SAMPLE_BOOL))
             sample_bool = Utils.str2bool(sample_bool_tmp) if isinstance(sample_bool_tmp, str) else sample_bool_tmp
 
-            sample_path = from_union([from_none, from_str], obj.get(CONFIG_SAMPLE_PATH))
+            sample_path = from_optional_str(obj.get(CONFIG_SAMPLE_PATH))
             if sample_path is not None:
                 sample_path = Utils.validate_path(sample_path)
 
-            sample_string = from_union([from_none, from_str], obj.get(CONFIG_SAMPLE_STRING))
-            sample_int = from_union([from_none, from_int], obj.get(CONFIG_SAMPLE_INT))
-            simple_list = from_union([lambda x: from_list(from_str, x), from_none], obj.get(CONFIG_SIMPLE_LIST))
+            sample_string = from_optional_str(obj.get(CONFIG_SAMPLE_STRING))
+            sample_int = from_optional_int(obj.get(CONFIG_SAMPLE_INT))
+            simple_list = from_union([from_str_list, from_none], obj.get(CONFIG_SIMPLE_LIST))
             object_list = from_union([lambda x: from_list(ObjectList.deserialize, x), from_none], obj.get(CONFIG_OBJECT_LIST))
         except TypeError as te:
             Logger.instance().critical(te.args)
@@ -103,14 +136,14 @@ class Config:
             Logger.instance().critical(fnf.args)
             sys.exit(-1)
         
-        Logger.instance().info(f"Config deserialized: " +
-            f"sample_bool: {sample_bool}, sample_path: {sample_path}, sample_string: {sample_string}, " +
-            f"sample_int: {sample_int}, simple_list: {simple_list}, object_list: {object_list}")
+        Logger.instance().info("Config deserialized: " +
+            "sample_bool: %s, sample_path: %s, sample_string: %s, " +
+            "sample_int: %s, simple_list: %s, object_list: %s",
+            sample_bool, sample_path, sample_string, sample_int, simple_list, object_list)
         
         return Config(sample_bool, sample_path, sample_string, sample_int, simple_list, object_list)
 
     def serialize(self, directory: str, filename: str):
-        result: dict = {}
         dire = None
 
         try:
@@ -120,16 +153,17 @@ class Config:
             sys.exit(-1)
         
         # if you do not want to write null values, add a field to result if and only if self.field is not None
-        result[CONFIG_SAMPLE_BOOL] = from_union([from_none, from_bool], self.sample_bool)
-        result[CONFIG_SAMPLE_PATH] = from_union([from_none, from_str], self.sample_path)
-        result[CONFIG_SAMPLE_STRING] = from_union([from_none, from_str], self.sample_string)
-        result[CONFIG_SAMPLE_INT] = from_union([from_none, from_int], self.sample_int)
-        result[CONFIG_SIMPLE_LIST] = from_union([lambda x: from_list(from_str, x), from_none], self.simple_list)
-        result[CONFIG_OBJECT_LIST] = from_union([lambda x: from_list(lambda y: to_class(ObjectList, y), x), from_none], self.object_list)
-
-        with open(os.path.join(dire, filename), "w") as f:
-            json_dict = json.dumps(result, indent=4)
-            f.write(json_dict)
+        result: dict = {
+            CONFIG_SAMPLE_BOOL: from_optional_bool(self.sample_bool),
+            CONFIG_SAMPLE_PATH: from_optional_str(self.sample_path),
+            CONFIG_SAMPLE_STRING: from_optional_str(self.sample_string),
+            CONFIG_SAMPLE_INT: from_optional_int(self.sample_int),
+            CONFIG_SIMPLE_LIST: from_union([from_str_list, from_none], self.simple_list),
+            CONFIG_OBJECT_LIST: from_union([lambda x: from_list(lambda y: to_class(ObjectList, y), x), from_none], self.object_list)
+        }
+
+        with open(os.path.join(dire, filename), "wb") as f:
+            f.write(Utils.dump_json(result))
 
         Logger.instance().info("Config serialized")
 
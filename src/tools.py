@@ -1,15 +1,29 @@
 import os
 import re
 import sys
+import copy
 import json
+import mmap
 import time
 import logging
+import logging.handlers
+
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
 # import matplotlib.pyplot as plt
 
-from typing import Type, Any, Optional, Union, List
+from typing import Type, Any, Optional, Union, List, BinaryIO
 
 from ..config.consts import T
 
+_WORD_RE = re.compile(r"[\w']+")
+# json integer literals that may not fit in 64 bits, which orjson would parse as float
+_BIG_INT_RE = re.compile(rb"(?<![\d.eE+-])\d{19,}(?![\d.eE])")
+_TRUE_SET = frozenset(("true", "yes", "y"))
+
 
 class Singleton:
     """
@@ -33,6 +47,7 @@ class Singleton:
 
     def __init__(self, decorated):
         self._decorated = decorated
+        self._instance = None
 
     def instance(self):
         """
@@ -41,11 +56,10 @@ class Singleton:
         On all subsequent calls, the already created instance is returned.
 
         """
-        try:
-            return self._instance
-        except AttributeError:
-            self._instance = self._decorated()
-            return self._instance
+        inst = self._instance
+        if inst is None:
+            inst = self._instance = self._decorated()
+        return inst
 
     def __call__(self):
         raise TypeError('Singletons must be accessed through `instance()`.')
@@ -54,15 +68,55 @@ class Singleton:
         return isinstance(inst, self._decorated)
 
 
+def _cs_em(s: str, options: List[str]) -> bool:
+    return any(s == x for x in options)
+
+def _cs_sub(s: str, options: List[str]) -> bool:
+    return any(s in x for x in options)
+
+def _ci_em(s: str, options: List[str]) -> bool:
+    sl = s.lower()
+    return any(sl == x.lower() for x in options)
+
+def _ci_sub(s: str, options: List[str]) -> bool:
+    sl = s.lower()
+    return any(sl in x.lower() for x in options)
+
+# (case_sensitive, exact_match) -> check_string worker
+_CHECK_STRING_TABLE = {
+    (True, True): _cs_em,
+    (True, False): _cs_sub,
+    (False, True): _ci_em,
+    (False, False): _ci_sub
+}
+
+def _loads(buf: Any) -> Any:
+    # orjson parses the buffer in place; big integers and the stdlib fallback need a bytes copy for json.loads
+    if _HAS_ORJSON and _BIG_INT_RE.search(buf) is None:
+        return orjson.loads(buf)
+    return json.loads(bytes(buf))
+
+def _load_json_file(f: BinaryIO) -> Any:
+    try:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (ValueError, OSError):
+        # empty files and non-regular files (pipes, procfs, ...) cannot be mapped
+        return _loads(f.read())
+
+    with mm, memoryview(mm) as view:
+        return _loads(view)
+
+
 class Utils:
 
     @staticmethod
     def str2bool(s: str) -> bool:
-        return s.lower() in ("true", "yes", "y")
+        # no accepted value is longer than 4 chars, so skip lowercasing anything longer
+        return len(s) <= 4 and s.lower() in _TRUE_SET
 
     @staticmethod
     def str2lst(s: str) -> List[Any]:
-        return re.findall(r"[\w']+", s)
+        return _WORD_RE.findall(s)
 
     @staticmethod
     def check_string(s: str, options: List[str], case_sensitive: bool, exact_match: bool) -> bool:
@@ -81,16 +135,7 @@ class Utils:
             True if condition is met, False otherwise
         """
         
-        if case_sensitive:
-            if exact_match:
-                return any(map(lambda x: s == x, options))
-            else:
-                return any(map(lambda x: s in x, options))
-        else:
-            if exact_match:
-                return any(map(lambda x: s.lower() == x.lower(), options))
-            else:
-                return any(map(lambda x: s.lower() in x.lower(), options))
+        return _CHECK_STRING_TABLE[(bool(case_sensitive), bool(exact_match))](s, options)
 
     @staticmethod
     def validate_path(s: str) -> str:
@@ -126,16 +171,31 @@ class Utils:
                 Logger.instance().critical("json path is null")
                 sys.exit(-1)
 
-        with open(json_path, "r") as f:
+        with open(json_path, "rb") as f:
             obj = None
             try:
-                obj = json.loads(f.read().replace("\n", ""))
+                obj = _load_json_file(f)
                 Utils.check_instance(obj, dict, error_json=True)
             except TypeError as te:
                 Logger.instance().critical(f"{te.args}")
                 sys.exit(-1)
             return obj
 
+    @staticmethod
+    def dump_json(obj: Any) -> bytes:
+        """Serialize obj to 2-space indented, utf-8 encoded json, using orjson when available
+
+        Both backends produce the same bytes: orjson only supports a 2-space indent and never escapes non-ASCII.
+        """
+
+        if _HAS_ORJSON:
+            try:
+                return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+            except orjson.JSONEncodeError:
+                # e.g. integers beyond 64 bits, which the stdlib encoder handles
+                pass
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
     @staticmethod
     def check_instance(val: Any, class_type: Optional[Type[T]], **kwargs) -> bool:
         arg_json = "Provide json string" if kwargs.get("error_json", None) else None
@@ -157,10 +217,11 @@ class Utils:
     
     @staticmethod
     def invert_dict(in_dict: dict) -> dict:
-        if not len(list(in_dict.values())) == len(set(in_dict.values())):
+        out = { v: k for k, v in in_dict.items() }
+        if len(out) != len(in_dict):
             raise ValueError("The dictionary cannot be inverted as its values are not unique")
 
-        return { v: k for k, v in in_dict.items() }
+        return out
     
     @staticmethod
     def elapsed_time(start: float, *args) -> str:
@@ -176,13 +237,40 @@ class Utils:
             (str) time elapsed in the format days:hours:min:sec
         """
         
-        end = time.time() - start
+        end = int(time.time() - start)
 
         days, r = divmod(end, 86400)
         hours, r = divmod(r, 3600)
         mins, sec = divmod(r, 60)
         
-        return f"Elapsed time at {args} is {int(days)}days:{int(hours)}h:{int(mins)}m:{int(sec)}s"
+        return f"Elapsed time at {args} is {days}days:{hours}h:{mins}m:{sec}s"
+
+
+class _FormattedMemoryHandler(logging.handlers.MemoryHandler):
+    """MemoryHandler that renders the message when a record is buffered, not when it is flushed
+
+    Records carry their %-style args by reference, so formatting at flush time would log the state those objects
+    have later on (possibly at interpreter shutdown) instead of the state at the time of the call.
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # the record is shared with the other handlers, so the rendered message goes on a copy
+        try:
+            msg = record.getMessage()
+        except Exception:
+            self.handleError(record)
+            return
+
+        record = copy.copy(record)
+        record.msg = msg
+        record.args = None
+        super().emit(record)
+
+
+class _OnlyDebug(logging.Filter):
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.levelno == logging.DEBUG
 
 
 @Singleton
@@ -203,33 +291,37 @@ class Logger:
         file_handler = logging.FileHandler(log_file_path)
         file_handler.setFormatter(formatter)
 
+        # batch file writes; records are flushed on errors, when the buffer is full and at interpreter shutdown.
+        # A process killed before any of these loses its buffered (below ERROR) records
+        memory_handler = _FormattedMemoryHandler(capacity=256, flushLevel=logging.ERROR, target=file_handler)
+
         out_handler = logging.StreamHandler(sys.stdout)
         out_handler.setLevel(logging.DEBUG)
-        out_handler.addFilter(lambda record: record.levelno == logging.DEBUG)
+        out_handler.addFilter(_OnlyDebug())
         out_handler.setFormatter(formatter)
 
         err_handler = logging.StreamHandler(sys.stderr)
         err_handler.setLevel(logging.WARNING)
         err_handler.setFormatter(formatter)
 
-        self.logger.addHandler(file_handler)
+        self.logger.addHandler(memory_handler)
         self.logger.addHandler(out_handler)
         self.logger.addHandler(err_handler)
 
-    def info(self, msg: str) -> None:
-        self.logger.info(msg)
+    def info(self, msg: str, *args) -> None:
+        self.logger.info(msg, *args)
 
-    def debug(self, msg: str) -> None:
-        self.logger.debug(msg)
+    def debug(self, msg: str, *args) -> None:
+        self.logger.debug(msg, *args)
 
-    def warning(self, msg: str) -> None:
-        self.logger.warning(msg)
+    def warning(self, msg: str, *args) -> None:
+        self.logger.warning(msg, *args)
 
-    def error(self, msg: str) -> None:
-        self.logger.error(msg)
+    def error(self, msg: str, *args) -> None:
+        self.logger.error(msg, *args)
 
-    def critical(self, msg: str) -> None:
-        self.logger.critical(msg)
+    def critical(self, msg: str, *args) -> None:
+        self.logger.critical(msg, *args)
 
 
 # class Plotter: